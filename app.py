@@ -5,17 +5,28 @@ Interactive web application for visualizing historical tropical cyclone tracks f
 """
 
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
+from requests_cache import CachedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import re
+import io
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
+import matplotlib
+matplotlib.use('Agg')  # Plots are only ever rendered to PNG bytes
+import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib import patheffects
+from mpl_toolkits.basemap import Basemap, basemap_datadir
+from PIL import Image
 from urllib.parse import urljoin
+import os
 import warnings
-import gc
 import time
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 warnings.filterwarnings('ignore')
 
@@ -60,23 +71,62 @@ BASINS = {
     }
 }
 
-@st.cache_data(ttl=3600)
-def get_intensity_color(wind_speed):
-    """Return color and category for wind speed using Saffir-Simpson scale."""
-    if pd.isna(wind_speed) or wind_speed < 34:
-        return '#8AED8F', 'TD'
-    elif wind_speed < 64:
-        return '#127987', 'TS'
-    elif wind_speed < 83:
-        return 'white', 'Cat1'
-    elif wind_speed < 96:
-        return '#FF8C00', 'Cat2'
-    elif wind_speed < 113:
-        return '#FF0000', 'Cat3'
-    elif wind_speed < 137:
-        return '#8B008B', 'Cat4'
-    else:
-        return '#000000', 'Cat5'
+# On-disk HTTP cache lifetime for IBTrACS pages
+HTTP_CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# Lifetime for finalized past-season storm pages; long, but finite so a bad
+# response (e.g. a maintenance page served with status 200) eventually ages out
+ARCHIVED_STORM_EXPIRE_AFTER = timedelta(days=90)
+
+# Number of listed storms whose track pages are fetched ahead of a click
+PREFETCH_STORM_COUNT = 5
+
+# Longest a foreground fetch waits (seconds) on a running prefetch of the same page
+PREFETCH_WAIT_TIMEOUT = 5
+
+# Grid (degrees) that map extents snap outward to; coarser means more Basemap cache hits
+MAP_BOUNDS_STEP = 2
+
+# Precompiled patterns for the storm list and track row parsing loops
+_RE_STAR = re.compile(r'\*')
+_RE_DATE1 = re.compile(r'\s+[A-Z][a-z]{2}\s+\d{1,2}-\d{1,2}')
+_RE_DATE2 = re.compile(r'\s+[A-Z][a-z]{2}\s+\d{1,2}-[A-Z][a-z]{2}\s+\d{1,2}')
+_RE_DATE_LINE = re.compile(r'^[A-Z][a-z]{2}\s+\d')
+_RE_FULL_TS = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
+_RE_HOUR = re.compile(r'\d{2}:\d{2}:\d{2}')
+_RE_HOUR_EXTRACT = re.compile(r'(\d{2}):\d{2}:\d{2}')
+_RE_TS_FULL = re.compile(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})')
+_RE_SID_YEAR = re.compile(r'name=v04r01-(\d{4})')
+
+# Precompiled XPath queries for the IBTrACS table scans
+_XP_BASIN_TABLE = etree.XPath("(//table[.//tr[contains(., $name)]])[1]")
+# First table whose first row mentions lat, lon and wind in any letter case
+_XP_TRACK_TABLE = etree.XPath(
+    "(//table[(.//tr)[1][contains(translate(., 'LATONWID', 'latonwid'), 'lat')"
+    " and contains(translate(., 'LATONWID', 'latonwid'), 'lon')"
+    " and contains(translate(., 'LATONWID', 'latonwid'), 'wind')]])[1]"
+)
+_XP_ROWS = etree.XPath('.//tr')
+_XP_CELLS = etree.XPath('.//td|.//th')
+_XP_STORM_LINKS = etree.XPath(".//a[contains(@href, 'name=v04r01-')]")
+_XP_HAS_LINK = etree.XPath('boolean(.//a[@href])')
+# Same query lxml.html's text_content() runs, usable on plain etree elements
+_XP_TEXT = etree.XPath('string()', smart_strings=False)
+
+# Saffir-Simpson category lower bounds (kt) with matching marker colors and labels;
+# the trailing entry is used for points without wind data
+_WIND_THRESHOLDS = np.array([34, 64, 83, 96, 113, 137])
+# NaN sorts after +inf, so this extra edge bins missing winds as 'No Data' in one search
+_WIND_BIN_EDGES = np.append(_WIND_THRESHOLDS, np.inf)
+_WIND_COLORS = np.array(['#8AED8F', '#127987', 'white', '#FF8C00', '#FF0000', '#8B008B', '#000000', 'white'])
+_WIND_CATS = np.array(['TD', 'TS', 'Cat1', 'Cat2', 'Cat3', 'Cat4', 'Cat5', 'No Data'])
+_WIND_RGBA = mcolors.to_rgba_array(_WIND_COLORS)
+
+def get_intensity_colors(wind_speeds):
+    """Return RGBA colors and int8 indices into _WIND_CATS for an array of wind speeds using Saffir-Simpson scale."""
+    winds = np.asarray(wind_speeds, dtype=float)
+    idx = np.searchsorted(_WIND_BIN_EDGES, winds, side='right').astype(np.int8)
+    return _WIND_RGBA[idx], idx
 
 def determine_storm_type(lat_center, lon_center):
     """Determine storm type based on geographic basin."""
@@ -91,11 +141,11 @@ def determine_storm_type(lat_center, lon_center):
 
 def calculate_ace_value(wind_speeds):
     """Calculate Accumulated Cyclone Energy (ACE)."""
-    ace = 0.0
-    for wind in wind_speeds:
-        if not pd.isna(wind) and wind >= 34:
-            ace += (wind ** 2) / 10000
-    return ace
+    winds = np.asarray(wind_speeds, dtype=float)
+    # NaN compares False, so missing winds drop out of the mask
+    winds = winds[winds >= 34]
+    # Sum of squares as a single dot product, with no temporary squared array
+    return float(np.dot(winds, winds) / 10000)
 
 def convert_knots_to_mph(knots):
     """Convert wind speed from knots to mph."""
@@ -103,37 +153,30 @@ def convert_knots_to_mph(knots):
         return "N/A"
     return int(knots * 1.15078)
 
+_MONTHS = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+_ORDINAL_SUFFIXES = {1: 'st', 2: 'nd', 3: 'rd'}
+
+def _ordinal(day):
+    """Return a day number with its English ordinal suffix."""
+    day_int = int(day)
+    suffix = 'th' if 10 <= day_int % 100 <= 13 else _ORDINAL_SUFFIXES.get(day_int % 10, 'th')
+    return f"{day_int}{suffix}"
+
 def format_datetime(datetime_str):
     """Convert IBTrACS datetime to readable format."""
-    if not datetime_str or datetime_str == '-' or pd.isna(datetime_str):
+    # datetime_str != datetime_str catches a float NaN without pandas dispatch
+    if not datetime_str or datetime_str == '-' or datetime_str != datetime_str:
         return "N/A"
     
     try:
-        months = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        
-        def add_ordinal_suffix(day):
-            day_int = int(day)
-            if 10 <= day_int <= 13:
-                return f"{day_int}th"
-            elif day_int % 10 == 1:
-                return f"{day_int}st"
-            elif day_int % 10 == 2:
-                return f"{day_int}nd"
-            elif day_int % 10 == 3:
-                return f"{day_int}rd"
-            else:
-                return f"{day_int}th"
-        
-        match = re.search(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})', datetime_str)
+        match = _RE_TS_FULL.search(datetime_str)
         if match:
             year, month, day, hour, minute, second = match.groups()
-            month_name = months.get(month, f"Month{month}")
-            day_ordinal = add_ordinal_suffix(int(day))
-            return f"{month_name} {day_ordinal} at {hour}:{minute} UTC"
+            month_num = int(month)
+            month_name = _MONTHS[month_num] if 1 <= month_num <= 12 else f"Month{month}"
+            return f"{month_name} {_ordinal(day)} at {hour}:{minute} UTC"
         
         return datetime_str[:25]
     except:
@@ -143,52 +186,146 @@ def extract_basin_from_url(url):
     """Extract basin code from IBTrACS URL - kept for compatibility."""
     return 'UNKNOWN'
 
+@st.cache_resource
+def get_http_session():
+    """Return a shared HTTP session with an on-disk cache, keep-alive, compression and retries."""
+    session = CachedSession(
+        'ibtracs_cache',
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        allowable_codes=(200,),
+        stale_if_error=True,
+        wal=True  # prefetch threads and other server processes read while one writes
+    )
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': 'tc-track-plotter'
+    })
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_storm_cache_expiry(storm_url):
+    """Return how long a storm page may be cached; finalized past seasons rarely change."""
+    match = _RE_SID_YEAR.search(storm_url)
+    # The storm ID starts with the genesis year; allow a year for best-track revisions
+    if match and int(match.group(1)) < time.gmtime().tm_year - 1:
+        return ARCHIVED_STORM_EXPIRE_AFTER
+    return HTTP_CACHE_EXPIRE_AFTER
+
+def get_year_page_url(year):
+    """Return the IBTrACS storm index page URL for a year."""
+    return f"https://ncics.org/ibtracs/index.php?name=YearBasin-{year}"
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Return the shared background pool used to warm the HTTP cache."""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def get_prefetch_futures():
+    """Return the shared map of URL to in-flight prefetch future."""
+    return {}
+
+def warm_http_cache(session, url, expire_after=HTTP_CACHE_EXPIRE_AFTER):
+    """Fetch a page into the HTTP cache, ignoring any failure."""
+    try:
+        session.get(url, timeout=30, expire_after=expire_after)
+    except Exception:
+        pass
+
+def submit_prefetch(url, expire_after=HTTP_CACHE_EXPIRE_AFTER):
+    """Queue a background fetch of url unless it is cached or already in flight."""
+    futures = get_prefetch_futures()
+    pending = futures.get(url)
+    if pending is not None and not pending.done():
+        return
+    
+    # A key lookup, so reruns skip pages already stored without deserializing them
+    session = get_http_session()
+    if session.cache.contains(url=url):
+        return
+    
+    future = get_prefetch_executor().submit(warm_http_cache, session, url, expire_after)
+    futures[url] = future
+    # Only drop the entry if a newer prefetch of the same URL has not replaced it
+    future.add_done_callback(lambda done: futures.get(url) is done and futures.pop(url, None))
+
+def wait_for_prefetch(url):
+    """Briefly wait on a running prefetch of url; drop one still queued behind others."""
+    pending = get_prefetch_futures().get(url)
+    if pending is None or pending.cancel():
+        return
+    try:
+        pending.result(timeout=PREFETCH_WAIT_TIMEOUT)
+    except Exception:
+        pass  # Timed out; the caller fetches the page itself
+
+def prefetch_likely_pages(storms, adjacent_years):
+    """Warm the HTTP cache with the first listed storm pages and adjacent year pages."""
+    for storm in storms[:PREFETCH_STORM_COUNT]:
+        if storm['url']:
+            submit_prefetch(storm['url'], get_storm_cache_expiry(storm['url']))
+    
+    for year in adjacent_years:
+        submit_prefetch(get_year_page_url(year))
+
+def fetch_html_tree(url, expire_after=HTTP_CACHE_EXPIRE_AFTER):
+    """Stream a page into lxml's incremental parser and return the document root."""
+    # Let a background prefetch of the same page finish rather than download it twice
+    wait_for_prefetch(url)
+    with get_http_session().get(url, timeout=30, stream=True, expire_after=expire_after) as response:
+        response.raise_for_status()
+        # Only trust an explicit charset; otherwise let lxml sniff <meta> like fromstring does
+        has_charset = 'charset' in response.headers.get('Content-Type', '').lower()
+        parser = etree.HTMLParser(encoding=response.encoding if has_charset else None)
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            parser.feed(chunk)
+    return parser.close()
+
+@st.cache_resource(ttl=7200, max_entries=8, show_spinner=False)
+def get_year_page_tree(year):
+    """Parse a year's index page once and share the tree across basin lookups.
+    
+    The tree is only read with XPath after parsing, so concurrent sessions can
+    query it safely.
+    """
+    return fetch_html_tree(get_year_page_url(year))
+
 @st.cache_data(ttl=7200)
 def get_storms_for_basin_year(basin_name, year):
     """Get list of storms for a specific basin and year by parsing the column structure."""
     try:
-        year_page_url = f"https://ncics.org/ibtracs/index.php?name=YearBasin-{year}"
+        year_page_url = get_year_page_url(year)
         
-        response = requests.get(year_page_url, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = get_year_page_tree(year)
         
         basin_config = BASINS[basin_name]
         target_column = basin_config["column_index"]
         
         storms = []
+        seen = set()  # (upper-cased storm name, basin code) keys already listed
         
-        # Find all tables and look for the one with basin data
-        main_table = None
+        # Locate the first table with a row naming this basin in a single XPath query
+        tables = _XP_BASIN_TABLE(tree, name=basin_config["column_name"])
+        main_table = tables[0] if tables else None
         
-        # Look for tables that have the basin headers
-        for table in soup.find_all('table'):
-            # Get all text from the table to check for basin names
-            table_text = table.get_text()
-            
-            # Check if this table contains multiple basin names
-            basin_count = 0
-            for basin_key in BASINS.keys():
-                basin_column_name = BASINS[basin_key]["column_name"]
-                if basin_column_name in table_text:
-                    basin_count += 1
-            
-            # If we found multiple basins, this is likely our main table
-            if basin_count >= 3:  # At least 3 basin names found
-                main_table = table
-                break
-        
-        if not main_table:
+        if main_table is None:
             st.warning(f"Could not find main basin table for {year}")
             return []
         
         # Parse the table structure more carefully
-        rows = main_table.find_all('tr')
+        rows = _XP_ROWS(main_table)
         
         # Find the header row that contains basin names
         header_row_index = -1
         for i, row in enumerate(rows):
-            row_text = row.get_text()
+            row_text = _XP_TEXT(row)
             if basin_config["column_name"] in row_text:
                 header_row_index = i
                 break
@@ -200,7 +337,7 @@ def get_storms_for_basin_year(basin_name, year):
         # Process data rows starting after the header
         for row_index in range(header_row_index + 1, len(rows)):
             row = rows[row_index]
-            cells = row.find_all(['td', 'th'])
+            cells = _XP_CELLS(row)
             
             # Make sure we have enough columns
             if len(cells) <= target_column:
@@ -209,43 +346,54 @@ def get_storms_for_basin_year(basin_name, year):
             target_cell = cells[target_column]
             
             # Extract storm links from this cell
-            storm_links = target_cell.find_all('a', href=True)
+            storm_links = _XP_STORM_LINKS(target_cell)
             
             for link in storm_links:
-                if 'name=v04r01-' in link['href']:
-                    storm_text = link.get_text().strip()
-                    link_url = urljoin(year_page_url, link['href'])
+                storm_text = _XP_TEXT(link).strip()
+                link_url = urljoin(year_page_url, link.get('href'))
+                
+                if storm_text and len(storm_text) > 0:
+                    # Clean up storm name
+                    clean_name = _RE_STAR.sub('', storm_text)
+                    clean_name = _RE_DATE1.sub('', clean_name)
+                    clean_name = _RE_DATE2.sub('', clean_name)
+                    clean_name = clean_name.strip()
                     
-                    if storm_text and len(storm_text) > 0:
-                        # Clean up storm name
-                        clean_name = re.sub(r'\*', '', storm_text)
-                        clean_name = re.sub(r'\s+[A-Z][a-z]{2}\s+\d{1,2}-\d{1,2}', '', clean_name)
-                        clean_name = re.sub(r'\s+[A-Z][a-z]{2}\s+\d{1,2}-[A-Z][a-z]{2}\s+\d{1,2}', '', clean_name)
-                        clean_name = clean_name.strip()
-                        
-                        display_name = clean_name if clean_name else storm_text
-                        
-                        storms.append({
-                            'display_name': display_name,
-                            'storm_name': display_name,
-                            'url': link_url,
-                            'basin': basin_config["code"]
-                        })
+                    display_name = clean_name if clean_name else storm_text
+                    
+                    # Skip duplicates
+                    identifier = (display_name.upper(), basin_config["code"])
+                    if identifier in seen:
+                        continue
+                    seen.add(identifier)
+                    
+                    storms.append({
+                        'display_name': display_name,
+                        'storm_name': display_name,
+                        'url': link_url,
+                        'basin': basin_config["code"]
+                    })
             
             # Also check for text-only storm names (storms without track data)
-            if not storm_links:
-                cell_text = target_cell.get_text().strip()
+            if not storm_links and not _XP_HAS_LINK(target_cell):
+                cell_text = _XP_TEXT(target_cell).strip()
                 if cell_text and cell_text not in ['', '-', 'UNNAMED']:
                     # Split by lines to handle multiple storms in one cell
                     lines = [line.strip() for line in cell_text.split('\n') if line.strip()]
                     for line in lines:
                         # Skip date-like patterns
-                        if not re.match(r'^[A-Z][a-z]{2}\s+\d', line):
-                            clean_name = re.sub(r'\*', '', line)
-                            clean_name = re.sub(r'\s+[A-Z][a-z]{2}\s+\d{1,2}-\d{1,2}', '', clean_name)
+                        if not _RE_DATE_LINE.match(line):
+                            clean_name = _RE_STAR.sub('', line)
+                            clean_name = _RE_DATE1.sub('', clean_name)
                             clean_name = clean_name.strip()
                             
                             if clean_name and len(clean_name) > 1:
+                                # Skip duplicates
+                                identifier = (clean_name.upper(), basin_config["code"])
+                                if identifier in seen:
+                                    continue
+                                seen.add(identifier)
+                                
                                 storms.append({
                                     'display_name': f"{clean_name} (No track data)",
                                     'storm_name': clean_name,
@@ -253,18 +401,9 @@ def get_storms_for_basin_year(basin_name, year):
                                     'basin': basin_config["code"]
                                 })
         
-        # Remove duplicates and sort
-        seen = set()
-        unique_storms = []
-        for storm in storms:
-            identifier = f"{storm['storm_name'].upper()}_{storm['basin']}"
-            if identifier not in seen:
-                seen.add(identifier)
-                unique_storms.append(storm)
-        
-        unique_storms.sort(key=lambda x: x['storm_name'])
+        storms.sort(key=lambda x: x['storm_name'])
         
-        return unique_storms
+        return storms
         
     except Exception as e:
         st.error(f"Error fetching storms for {basin_name} {year}: {e}")
@@ -274,25 +413,17 @@ def get_storms_for_basin_year(basin_name, year):
 def extract_storm_data(storm_url):
     """Extract and process storm track data from IBTrACS."""
     try:
-        response = requests.get(storm_url, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Locate the data table
-        data_table = None
-        for table in soup.find_all('table'):
-            header_row = table.find('tr')
-            if header_row:
-                header_text = header_row.get_text().lower()
-                if all(x in header_text for x in ['lat', 'lon', 'wind']):
-                    data_table = table
-                    break
-        
-        if not data_table:
+        tree = fetch_html_tree(storm_url, expire_after=get_storm_cache_expiry(storm_url))
+        
+        # Locate the data table in a single XPath query
+        tables = _XP_TRACK_TABLE(tree)
+        if not tables:
             raise ValueError("Could not find storm data table")
+        data_table = tables[0]
         
-        # Parse table headers
-        headers = [th.get_text().strip() for th in data_table.find('tr').find_all(['th', 'td'])]
+        # Walk the table rows once: header cells first, then the data rows
+        rows = _XP_ROWS(data_table)
+        headers = [_XP_TEXT(cell).strip() for cell in _XP_CELLS(rows[0])]
         
         # Find column indices
         column_indices = {}
@@ -312,95 +443,127 @@ def extract_storm_data(storm_url):
         if 'lat' not in column_indices or 'lon' not in column_indices:
             raise ValueError("Required LAT/LON columns not found")
         
-        # Extract data rows
-        storm_data = []
-        current_date = None
+        # Collect the text of only the needed cells
+        column_items = list(column_indices.items())
+        max_col = max(column_indices.values())
+        column_text = {key: [] for key, _ in column_items}
+        for row in rows[1:]:
+            cells = _XP_CELLS(row)
+            if len(cells) > max_col:
+                for key, i in column_items:
+                    column_text[key].append(_XP_TEXT(cells[i]).strip())
+        
+        if not column_text['lat']:
+            raise ValueError("No valid storm data found")
+        
+        table_df = pd.DataFrame(column_text)
+        
+        # Convert the numeric columns, turning '-' and blanks into NaN
+        storm_data = pd.DataFrame({
+            key: pd.to_numeric(table_df[key], errors='coerce')
+            if key in column_indices else np.nan
+            for key in ['lat', 'lon', 'wind', 'pressure']
+        })
         
-        for row in data_table.find_all('tr')[1:]:  # Skip header
-            cells = row.find_all(['td', 'th'])
-            max_col = max(column_indices.values())
+        # Wind (kt) and pressure (mb) are whole numbers; nullable Int16 keeps gaps as NA
+        storm_data = storm_data.round({'wind': 0, 'pressure': 0}).astype({'wind': 'Int16', 'pressure': 'Int16'})
+        
+        if 'time' in column_indices:
+            time_text = table_df['time']
             
-            if len(cells) > max_col:
-                try:
-                    lat = float(cells[column_indices['lat']].get_text().strip())
-                    lon = float(cells[column_indices['lon']].get_text().strip())
-                    
-                    wind = np.nan
-                    if 'wind' in column_indices:
-                        wind_text = cells[column_indices['wind']].get_text().strip()
-                        if wind_text and wind_text not in ['-', '']:
-                            try:
-                                wind = float(wind_text)
-                            except:
-                                wind = np.nan
-                    
-                    pressure = np.nan
-                    if 'pressure' in column_indices:
-                        pressure_text = cells[column_indices['pressure']].get_text().strip()
-                        if pressure_text and pressure_text not in ['-', '']:
-                            try:
-                                pressure = float(pressure_text)
-                            except:
-                                pressure = np.nan
-                    
-                    full_datetime = None
-                    if 'time' in column_indices:
-                        time_text = cells[column_indices['time']].get_text().strip()
-                        
-                        if re.match(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', time_text):
-                            current_date = time_text[:10]
-                            full_datetime = time_text
-                        elif re.match(r'\d{2}:\d{2}:\d{2}', time_text) and current_date:
-                            full_datetime = f"{current_date} {time_text}"
-                        else:
-                            full_datetime = time_text
-                    
-                    # Filter for 6-hour intervals
-                    is_6hour_interval = True
-                    if full_datetime:
-                        hour_match = re.search(r'(\d{2}):\d{2}:\d{2}', full_datetime)
-                        if hour_match:
-                            hour = int(hour_match.group(1))
-                            is_6hour_interval = hour in [0, 6, 12, 18]
-                    
-                    if is_6hour_interval:
-                        storm_data.append({
-                            'lat': lat,
-                            'lon': lon,
-                            'wind': wind,
-                            'pressure': pressure,
-                            'datetime': full_datetime
-                        })
-                        
-                except (ValueError, IndexError):
-                    continue
+            # Carry the last full date forward onto rows that only list a time of day
+            is_full = time_text.str.match(_RE_FULL_TS)
+            current_date = time_text.str.slice(0, 10).where(is_full).ffill()
+            is_time_only = ~is_full & time_text.str.match(_RE_HOUR) & current_date.notna()
+            full_datetime = time_text.mask(is_time_only, current_date + ' ' + time_text)
+            storm_data['datetime'] = full_datetime
+            
+            # Filter for 6-hour intervals, keeping rows without a recognizable hour
+            hour = pd.to_numeric(full_datetime.str.extract(_RE_HOUR_EXTRACT, expand=False), errors='coerce')
+            is_6hour_interval = hour.isna() | hour.isin((0, 6, 12, 18))
+            storm_data = storm_data[is_6hour_interval]
+        else:
+            storm_data['datetime'] = None
+        
+        storm_data = storm_data.dropna(subset=['lat', 'lon']).reset_index(drop=True)
         
-        if not storm_data:
+        if storm_data.empty:
             raise ValueError("No valid storm data found")
         
-        return pd.DataFrame(storm_data)
+        return storm_data
         
     except Exception as e:
         raise ValueError(f"Error extracting storm data: {e}")
 
-def create_storm_plot(storm_data, storm_name, year, basin_name):
-    """Create the storm track visualization for Streamlit."""
+@st.cache_resource(max_entries=32)
+def get_basemap(llcrnrlon, llcrnrlat, urcrnrlon, urcrnrlat):
+    """Return a cylindrical Basemap for the given bounds, reused across plots.
+    
+    Building a Basemap loads and clips the coastline database, so callers pass
+    their own axes to each drawing call instead of binding one at construction.
+    """
+    return Basemap(
+        projection='cyl',
+        resolution='i',
+        llcrnrlon=llcrnrlon,
+        llcrnrlat=llcrnrlat,
+        urcrnrlon=urcrnrlon,
+        urcrnrlat=urcrnrlat
+    )
+
+@st.cache_resource
+def get_relief_raster(scale=0.5):
+    """Return Basemap's global shaded relief image as a south-up uint8 array.
+    
+    Basemap decodes and resizes this JPEG again for every new instance, which
+    costs over a second per map extent, so it is loaded once per process here.
+    """
+    image = Image.open(os.path.join(basemap_datadir, 'shadedrelief.jpg'))
+    width, height = image.size
+    image = image.convert('RGB').resize((round(width * scale), round(height * scale)), Image.LANCZOS)
+    return np.asarray(image)[::-1]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_relief_background(llcrnrlon, llcrnrlat, urcrnrlon, urcrnrlat):
+    """Crop the shaded relief raster to snapped map bounds, south row first."""
+    relief = get_relief_raster()
+    pixels_per_degree = relief.shape[1] / 360
+    row_lo = max(int(round((llcrnrlat + 90) * pixels_per_degree)), 0)
+    row_hi = min(int(round((urcrnrlat + 90) * pixels_per_degree)), relief.shape[0])
+    # Wrap column indices so extents crossing the dateline stay contiguous
+    cols = np.arange(int(round((llcrnrlon + 180) * pixels_per_degree)),
+                     int(round((urcrnrlon + 180) * pixels_per_degree))) % relief.shape[1]
+    return relief[row_lo:row_hi, cols]
+
+def create_storm_plot(storm_data, storm_name, year, basin_name, fast_render=False):
+    """Create the storm track visualization for Streamlit.
+    
+    With fast_render, flat land/sea fills replace the shaded relief raster.
+    """
     
     try:
+        # Pull each column out of pandas once
+        lats = storm_data['lat'].to_numpy()
+        lons = storm_data['lon'].to_numpy()
+        winds = storm_data['wind'].to_numpy(dtype=float, na_value=np.nan)
+        pressures = storm_data['pressure'].to_numpy(dtype=float, na_value=np.nan)
+        
         # Calculate geographic bounds
-        lat_min, lat_max = storm_data['lat'].min(), storm_data['lat'].max()
-        lon_min, lon_max = storm_data['lon'].min(), storm_data['lon'].max()
+        lat_min, lat_max = np.nanmin(lats), np.nanmax(lats)
+        lon_min, lon_max = np.nanmin(lons), np.nanmax(lons)
         
         # Add padding
         lat_range = lat_max - lat_min
         lon_range = lon_max - lon_min
         padding = max(lat_range, lon_range) * 0.25
         
+        # Snap outward to the bounds grid so nearby storms share a cached Basemap
+        step = MAP_BOUNDS_STEP
         map_bounds = {
-            'llcrnrlon': lon_min - padding,
-            'llcrnrlat': lat_min - padding,
-            'urcrnrlon': lon_max + padding,
-            'urcrnrlat': lat_max + padding
+            'llcrnrlon': float(np.floor((lon_min - padding) / step) * step),
+            'llcrnrlat': float(np.floor((lat_min - padding) / step) * step),
+            'urcrnrlon': float(np.ceil((lon_max + padding) / step) * step),
+            'urcrnrlat': float(np.ceil((lat_max + padding) / step) * step)
         }
         
         # Determine storm type
@@ -408,92 +571,73 @@ def create_storm_plot(storm_data, storm_name, year, basin_name):
         lon_center = (lon_min + lon_max) / 2
         storm_type = determine_storm_type(lat_center, lon_center)
         
-        # Create figure and basemap
-        fig, ax = plt.subplots(figsize=(16, 11))
+        # Create figure (outside pyplot, so concurrent sessions share no figure state) and basemap
+        fig = Figure(figsize=(16, 11))
+        ax = fig.subplots()
         
-        basemap = Basemap(
-            projection='cyl',
-            resolution='i',
-            **map_bounds,
-            ax=ax
-        )
+        basemap = get_basemap(**map_bounds)
         
-        # Add shaded relief background
-        basemap.shadedrelief(scale=0.5)
+        # Add background: flat fills in fast mode, shaded relief otherwise
+        if fast_render:
+            # Color the axes patch directly: drawmapboundary would stash this figure's
+            # patch on the shared Basemap, and later figures' coastlines clip to it
+            ax.set_facecolor('#b0c4de')
+            basemap.fillcontinents(color='#d0c090', lake_color='#b0c4de', ax=ax)
+        else:
+            background = render_relief_background(**map_bounds)
+            ax.imshow(background, origin='lower', zorder=0,
+                      extent=(map_bounds['llcrnrlon'], map_bounds['urcrnrlon'],
+                              map_bounds['llcrnrlat'], map_bounds['urcrnrlat']))
         
         # Add geographic features
-        basemap.drawcoastlines(linewidth=1.5, color='white')
-        basemap.drawcountries(linewidth=1.0, color='white')
+        basemap.drawcoastlines(linewidth=1.5, color='white', ax=ax)
+        basemap.drawcountries(linewidth=1.0, color='white', ax=ax)
         
         # Add coordinate grid
         parallels = np.arange(-90, 90, 5)
         meridians = np.arange(-180, 180, 5)
-        basemap.drawparallels(parallels, labels=[1,0,0,0], fontsize=9, color='white')
-        basemap.drawmeridians(meridians, labels=[0,0,0,1], fontsize=9, color='white')
+        basemap.drawparallels(parallels, labels=[1,0,0,0], fontsize=9, color='white', ax=ax)
+        basemap.drawmeridians(meridians, labels=[0,0,0,1], fontsize=9, color='white', ax=ax)
         
-        # Convert coordinates to map projection
-        track_x, track_y = basemap(storm_data['lon'].values, storm_data['lat'].values)
+        # Map coordinates are plain lon/lat on the cylindrical equidistant projection
+        track_x, track_y = lons, lats
         
-        # Plot storm track line
-        basemap.plot(track_x, track_y, color='white', linewidth=5, alpha=0.9, zorder=10)
-        basemap.plot(track_x, track_y, color='black', linewidth=3, alpha=0.9, zorder=11)
+        # Plot storm track line: one artist, a white halo stroke under the black core
+        track_line, = ax.plot(track_x, track_y, color='black', linewidth=3, alpha=0.9, zorder=11)
+        track_line.set_path_effects([patheffects.Stroke(linewidth=5, foreground='white'),
+                                     patheffects.Normal()])
         
         # Plot intensity points
-        has_wind_data = not storm_data['wind'].isna().all()
-        categories_list = []
+        has_wind_data = not np.isnan(winds).all()
+        colors, category_idx = get_intensity_colors(winds)
         
-        for idx, point in storm_data.iterrows():
-            if has_wind_data and not pd.isna(point['wind']):
-                color, category = get_intensity_color(point['wind'])
-            else:
-                color, category = 'white', 'No Data'
-            categories_list.append(category)
-            
-            x, y = basemap(point['lon'], point['lat'])
-            ax.scatter(x, y, c=color, s=70, edgecolors='black', 
-                       linewidth=1.8, zorder=12, alpha=0.95)
+        ax.scatter(track_x, track_y, c=colors, s=70, edgecolors='black', 
+                   linewidth=1.8, zorder=12, alpha=0.95)
         
         # Add start and end markers
-        start_x, start_y = basemap(storm_data.iloc[0]['lon'], storm_data.iloc[0]['lat'])
-        end_x, end_y = basemap(storm_data.iloc[-1]['lon'], storm_data.iloc[-1]['lat'])
+        start_x, start_y = track_x[0], track_y[0]
+        end_x, end_y = track_x[-1], track_y[-1]
         
-        ax.scatter(start_x, start_y, marker='s', s=180, c='lime', 
-                   edgecolors='black', linewidth=2.5, zorder=15)
-        ax.scatter(end_x, end_y, marker='s', s=180, c='red', 
+        ax.scatter([start_x, end_x], [start_y, end_y], marker='s', s=180, c=['lime', 'red'], 
                    edgecolors='black', linewidth=2.5, zorder=15)
         
         # Smart positioning for annotations to avoid track overlap
-        start_time = format_datetime(storm_data.iloc[0]['datetime'])
-        end_time = format_datetime(storm_data.iloc[-1]['datetime'])
+        datetimes = storm_data['datetime'].to_numpy()
+        start_time = format_datetime(datetimes[0])
+        end_time = format_datetime(datetimes[-1])
         
-        # Calculate safe positioning for annotations
+        # Offset each label perpendicular to its end segment of the track, in points
+        default_offsets = np.array([[60, 30], [60, -30]])
         if len(storm_data) > 1:
-            try:
-                start_dx = track_x[1] - track_x[0]
-                start_dy = track_y[1] - track_y[0]
-                track_length = np.sqrt(start_dx**2 + start_dy**2)
-                if track_length > 0:
-                    perp_x = -start_dy / track_length * 60
-                    perp_y = start_dx / track_length * 60
-                    start_offset = (perp_x + 50, perp_y + 20)
-                else:
-                    start_offset = (60, 30)
-                
-                end_dx = track_x[-1] - track_x[-2]
-                end_dy = track_y[-1] - track_y[-2]
-                track_length = np.sqrt(end_dx**2 + end_dy**2)
-                if track_length > 0:
-                    perp_x = -end_dy / track_length * 60
-                    perp_y = end_dx / track_length * 60
-                    end_offset = (perp_x + 50, perp_y - 20)
-                else:
-                    end_offset = (60, -30)
-            except:
-                start_offset = (60, 30)
-                end_offset = (60, -30)
+            segments = np.array([[track_x[1] - track_x[0], track_y[1] - track_y[0]],
+                                 [track_x[-1] - track_x[-2], track_y[-1] - track_y[-2]]])
+            lengths = np.hypot(segments[:, 0], segments[:, 1])[:, None]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                perpendicular = np.column_stack([-segments[:, 1], segments[:, 0]]) / lengths * 60
+            offsets = np.where(lengths > 0, perpendicular + [[50, 20], [50, -20]], default_offsets)
         else:
-            start_offset = (60, 30)
-            end_offset = (60, -30)
+            offsets = default_offsets
+        start_offset, end_offset = tuple(offsets[0]), tuple(offsets[1])
         
         # Add annotations with arrows
         ax.annotate(f'Start: {start_time}', xy=(start_x, start_y), xytext=start_offset,
@@ -513,25 +657,25 @@ def create_storm_plot(storm_data, storm_name, year, basin_name):
         # Create intensity legend
         if has_wind_data:
             legend_elements = [
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#8AED8F', markersize=8, 
-                          markeredgecolor='black', label='TD (<34 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#127987', markersize=8, 
-                          markeredgecolor='black', label='TS (34-63 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='white', markersize=8, 
-                          markeredgecolor='black', label='Cat 1 (64-82 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF8C00', markersize=8, 
-                          markeredgecolor='black', label='Cat 2 (83-95 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF0000', markersize=8, 
-                          markeredgecolor='black', label='Cat 3 (96-112 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#8B008B', markersize=8, 
-                          markeredgecolor='black', label='Cat 4 (113-136 kt)', linewidth=0),
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#000000', markersize=8, 
-                          markeredgecolor='black', label='Cat 5 (137+ kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#8AED8F', markersize=8, 
+                       markeredgecolor='black', label='TD (<34 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#127987', markersize=8, 
+                       markeredgecolor='black', label='TS (34-63 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='white', markersize=8, 
+                       markeredgecolor='black', label='Cat 1 (64-82 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF8C00', markersize=8, 
+                       markeredgecolor='black', label='Cat 2 (83-95 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF0000', markersize=8, 
+                       markeredgecolor='black', label='Cat 3 (96-112 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#8B008B', markersize=8, 
+                       markeredgecolor='black', label='Cat 4 (113-136 kt)', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#000000', markersize=8, 
+                       markeredgecolor='black', label='Cat 5 (137+ kt)', linewidth=0),
             ]
         else:
             legend_elements = [
-                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='white', markersize=8, 
-                          markeredgecolor='black', label='No Wind Data', linewidth=0),
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='white', markersize=8, 
+                       markeredgecolor='black', label='No Wind Data', linewidth=0),
             ]
         
         legend = ax.legend(handles=legend_elements, loc='upper left', 
@@ -540,10 +684,10 @@ def create_storm_plot(storm_data, storm_name, year, basin_name):
         legend.get_frame().set_facecolor('white')
         
         # Calculate statistics
-        max_wind = storm_data['wind'].max() if has_wind_data else np.nan
+        max_wind = np.nanmax(winds) if has_wind_data else np.nan
         max_wind_mph = convert_knots_to_mph(max_wind)
-        min_pressure = storm_data['pressure'].min() if not storm_data['pressure'].isna().all() else np.nan
-        ace_value = calculate_ace_value(storm_data['wind']) if has_wind_data else 0
+        min_pressure = np.nanmin(pressures) if not np.isnan(pressures).all() else np.nan
+        ace_value = calculate_ace_value(winds) if has_wind_data else 0
         
         # Add info boxes
         intensity_info = ""
@@ -577,7 +721,7 @@ def create_storm_plot(storm_data, storm_name, year, basin_name):
         ax.set_title(f'{storm_type} {storm_name} ({year})', 
                     fontsize=20, fontweight='bold', pad=25)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         return fig, {
             'storm_type': storm_type,
@@ -590,12 +734,25 @@ def create_storm_plot(storm_data, storm_name, year, basin_name):
             'duration_days': len(storm_data) * 6 / 24,
             'lat_extent': (lat_min, lat_max),
             'lon_extent': (lon_min, lon_max),
-            'categories': categories_list
+            'category_counts': dict(zip(_WIND_CATS.tolist(),
+                                        np.bincount(category_idx, minlength=len(_WIND_CATS)).tolist()))
         }
         
     except Exception as e:
         raise Exception(f"Error creating storm plot: {e}")
 
+@st.cache_data(ttl=86400, max_entries=64, show_spinner=False)
+def render_storm_png(storm_url, storm_name, year, basin_name, fast_render=False):
+    """Render a storm track plot to PNG bytes so reruns skip Matplotlib entirely."""
+    storm_data = extract_storm_data(storm_url)
+    fig, stats = create_storm_plot(storm_data, storm_name, year, basin_name, fast_render=fast_render)
+    
+    # No pyplot registry holds the figure, so it becomes garbage once this returns
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=110, bbox_inches='tight')
+    
+    return buffer.getvalue(), stats
+
 def main():
     """Main Streamlit application."""
     
@@ -628,6 +785,7 @@ def main():
         selected_storm_display = ""
         storms = []
         generate_button = False
+        fast_render = False
         
         # Storm selection (only show after basin and year are selected)
         if selected_basin and selected_year:
@@ -645,12 +803,30 @@ def main():
                 
                 if selected_storm_display:
                     st.info(f"**Processing Time:** 5-10 seconds for data download and plotting")
+                    
+                    # Start downloading the chosen track while the user reaches for the button
+                    storm_url = storm_options[selected_storm_display]['url']
+                    if storm_url:
+                        submit_prefetch(storm_url, get_storm_cache_expiry(storm_url))
+                
+                fast_render = st.checkbox(
+                    "Fast render",
+                    value=False,
+                    help="Draw flat land and sea instead of the shaded relief background"
+                )
                 
                 # Generate plot button
                 generate_button = st.button("Generate Storm Track Plot", type="primary")
             else:
                 st.warning(f"No storms found for {selected_basin} in {selected_year}")
                 st.info(f"💡 Try a different year - some years may have limited data for {selected_basin}")
+            
+            # Fetch the pages the user is likely to open next in the background,
+            # queued after the selected storm so its download starts first
+            prefetch_likely_pages(
+                storms,
+                [y for y in (selected_year - 1, selected_year + 1) if 1842 <= y <= current_year]
+            )
     
     with col2:
         st.subheader("Storm Track Visualization")
@@ -665,25 +841,20 @@ def main():
             else:
                 # Initialize stats to prevent UnboundLocalError
                 stats = None
-                fig = None
                 
                 try:
                     with st.spinner(f"Generating plot for {selected_storm['storm_name']}..."):
-                        # Extract storm data
-                        storm_data = extract_storm_data(selected_storm['url'])
-                        
-                        # Create plot
-                        fig, stats = create_storm_plot(
-                            storm_data, 
+                        # Render plot (cached per storm and render mode)
+                        png_bytes, stats = render_storm_png(
+                            selected_storm['url'], 
                             selected_storm['storm_name'], 
                             selected_year, 
-                            selected_basin
+                            selected_basin,
+                            fast_render=fast_render
                         )
                         
                         # Display plot
-                        st.pyplot(fig, use_container_width=True)
-                        plt.close(fig)
-                        gc.collect()
+                        st.image(png_bytes, use_container_width=True)
                         
                         st.success("✅ Storm track plot generated successfully!")
                         st.info("💡 Right-click on the plot to save it to your device.")
@@ -691,8 +862,6 @@ def main():
                 except Exception as e:
                     st.error(f"❌ Error generating plot: {e}")
                     st.info("💡 Please try a different storm or check your internet connection.")
-                    if fig is not None:
-                        plt.close(fig)
                 
                 # Display statistics only if stats was successfully created
                 if stats is not None:
@@ -730,21 +899,16 @@ def main():
                         st.metric("Longitude Range", f"{lon_min:.1f}°E to {lon_max:.1f}°E")
                     
                     # Intensity breakdown
-                    if stats['categories']:
+                    cat_counts = stats['category_counts']
+                    if any(cat_counts.values()):
                         st.subheader("🎯 Intensity Distribution")
-                        cat_counts = pd.Series(stats['categories']).value_counts()
                         
-                        intensity_data = []
-                        for cat in ['TD', 'TS', 'Cat1', 'Cat2', 'Cat3', 'Cat4', 'Cat5']:
-                            if cat in cat_counts:
-                                intensity_data.append({
-                                    'Category': cat,
-                                    'Points': cat_counts[cat],
-                                    'Hours': cat_counts[cat] * 6
-                                })
+                        present = [cat for cat in ['TD', 'TS', 'Cat1', 'Cat2', 'Cat3', 'Cat4', 'Cat5'] if cat_counts[cat]]
+                        points = np.array([cat_counts[cat] for cat in present], dtype=int)
                         
-                        if intensity_data:
-                            st.dataframe(pd.DataFrame(intensity_data), use_container_width=True)
+                        if present:
+                            intensity_df = pd.DataFrame({'Category': present, 'Points': points, 'Hours': points * 6})
+                            st.dataframe(intensity_df, use_container_width=True)
         
         elif not selected_basin or not selected_year:
             st.info("👆 Please select a basin and year from the dropdown menus on the left.")